@@ -3,6 +3,14 @@ from rest_framework.fields import SerializerMethodField as DRFSerializerMethodFi
 
 class SerializerMethodField(DRFSerializerMethodField):
 
+    def bind(self, field_name, parent):
+        super().bind(field_name, parent)
+        # The method is looked up on the parent on first use, and reused
+        # for every following value.
+        self._method = None
+
     async def ato_representation(self, value):
-        method = getattr(self.parent, self.method_name)
+        method = self._method
+        if method is None:
+            method = self._method = getattr(self.parent, self.method_name)
         return await method(value)
@@ -7,8 +7,85 @@ which allows mixin classes to be composed in interesting ways.
 from asgiref.sync import sync_to_async
 from rest_framework import status
 from rest_framework import mixins
+from rest_framework.fields import empty
+from rest_framework.relations import ManyRelatedField, RelatedField
 from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer, ListSerializer, ModelSerializer, Serializer
 from rest_framework.settings import api_settings
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+
+
+async def ais_valid(serializer, raise_exception=False):
+    """
+    Validate the serializer. `is_valid()` runs in a thread, since validation
+    may query the database, unless the serializer only uses validation that
+    is known to happen in memory.
+    """
+    if _validation_is_in_memory(serializer):
+        return serializer.is_valid(raise_exception=raise_exception)
+    return await sync_to_async(serializer.is_valid)(raise_exception=raise_exception)
+
+
+# Validation hooks which, when overridden, may run arbitrary code.
+_VALIDATION_METHODS = (
+    'is_valid', 'run_validation', 'run_validators', 'to_internal_value', 'validate',
+)
+
+
+def _overrides_validation(serializer, base_class):
+    return any(
+        getattr(type(serializer), name) is not getattr(base_class, name)
+        for name in _VALIDATION_METHODS
+    )
+
+
+def _is_in_memory_validator(validator):
+    return (
+        type(validator).__module__ == 'django.core.validators'
+        or isinstance(validator, ProhibitSurrogateCharactersValidator)
+    )
+
+
+def _validation_is_in_memory(serializer):
+    if isinstance(serializer, ListSerializer):
+        if _overrides_validation(serializer, ListSerializer) or serializer.validators:
+            return False
+        serializer = serializer.child
+
+    if (
+        not isinstance(serializer, Serializer)
+        or isinstance(serializer, ModelSerializer)
+        or _overrides_validation(serializer, Serializer)
+        or serializer.validators
+    ):
+        return False
+
+    for field_name, field in serializer.fields.items():
+        if field.read_only:
+            continue
+        if hasattr(serializer, 'validate_' + field_name):
+            return False
+        if not _field_validation_is_in_memory(field):
+            return False
+    return True
+
+
+def _field_validation_is_in_memory(field):
+    if isinstance(field, (RelatedField, ManyRelatedField)):
+        return False
+    if isinstance(field, BaseSerializer):
+        return _validation_is_in_memory(field)
+    if type(field).__module__ != 'rest_framework.fields':
+        # Custom field classes may run arbitrary code when validating.
+        return False
+    if field.default is not empty and callable(field.default):
+        # Callable defaults (e.g. of a `HiddenField`) run during validation.
+        return False
+    if not all(_is_in_memory_validator(validator) for validator in field.validators):
+        return False
+    # Container fields (`ListField`, `DictField`...) validate their child too.
+    child = getattr(field, 'child', None)
+    return child is None or _field_validation_is_in_memory(child)
 
 
 class CreateModelMixin(mixins.CreateModelMixin):
@@ -24,7 +101,7 @@ class CreateModelMixin(mixins.CreateModelMixin):
 
     async def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await ais_valid(serializer, raise_exception=True)
         await self.aperform_create(serializer)
         data = await serializer.adata
         headers = self.get_success_headers(data)
@@ -74,7 +151,7 @@ class UpdateModelMixin(mixins.UpdateModelMixin):
         partial = kwargs.pop('partial', False)
         instance = await self.aget_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
-        await sync_to_async(serializer.is_valid)(raise_exception=True)
+        await ais_valid(serializer, raise_exception=True)
         await self.aperform_update(serializer)
 
         if getattr(instance, '_prefetched_objects_cache', None):
@@ -2,11 +2,13 @@
 Pagination serializers determine the structure of the output that should
 be used for paginated responses.
 """
-from base64 import b64decode, b64encode
-from collections import OrderedDict
+import operator
+import struct
+from base64 import b64decode, urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from functools import partial
 from urllib import parse
 
-from asgiref.sync import sync_to_async
 from django.template import loader
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
@@ -15,7 +17,43 @@ from rest_framework.exceptions import NotFound
 from rest_framework.pagination import BasePagination as DRFBasePagination, _reverse_ordering, _positive_int, Cursor
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
-from rest_framework.utils.urls import replace_query_param
+
+# Cursors are encoded as a version byte, the offset and a flags byte,
+# followed by the UTF-8 encoded position (if any).
+_CURSOR_VERSION = 1
+_CURSOR_FLAG_REVERSE = 0x01
+_CURSOR_FLAG_POSITION = 0x02
+_CURSOR_HEADER = struct.Struct('!BIB')
+
+
+def _find_marker(positions, compare, is_uniform=None):
+    """
+    Scan `positions`, starting from the item next to the `compare` position,
+    and return the offset and position of the first item that can be used as
+    a cursor marker. The position is `None` if there is no unique position.
+
+    `is_uniform` is called only if the first item shares the `compare`
+    position, and should return whether every item does, in which case the
+    rest of the scan is skipped.
+    """
+    offset = 0
+    for position in positions:
+        if position != compare:
+            # The item in this position and the item following it
+            # have different positions. We can use this position as
+            # our marker.
+            return offset, position
+
+        if offset == 0 and is_uniform is not None and is_uniform():
+            # No item has a unique position, there is nothing to scan for.
+            return offset, None
+
+        # The item in this position has the same position as the item
+        # following it, we can't use it as a marker position, so increment
+        # the offset and keep seeking to the previous item.
+        compare = position
+        offset += 1
+    return offset, None
 
 
 class BasePagination(DRFBasePagination):
@@ -53,19 +91,66 @@ class CursorPagination(BasePagination):
     # queries, by having a hard cap on the maximum possible size of the offset.
     offset_cutoff = 1000
 
+    # Per-request state. Attributes that also have a class level default
+    # (such as `page_size` and `ordering`) cannot be slots, and the parent
+    # classes don't define `__slots__`, so instances still have a `__dict__`.
+    __slots__ = (
+        '_cached_links', '_gt_lookup', '_is_reversed', '_lt_lookup',
+        '_parsed_base_url', 'base_url', 'cursor', 'has_next', 'has_previous',
+        'next_position', 'page', 'previous_position',
+    )
+
     def paginate_queryset(self, queryset, request, view=None):
+        queryset = self._prepare_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+
+        # If we have an offset cursor then offset the entire page by that amount.
+        # We also always fetch an extra item in order to determine if there is a
+        # page following on from this one.
+        offset = self.cursor.offset if self.cursor is not None else 0
+        results = list(queryset[offset:offset + self.page_size + 1])
+        return self._build_page(results)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        queryset = self._prepare_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+
+        offset = self.cursor.offset if self.cursor is not None else 0
+        fetch_size = self.page_size + 1
+        page_queryset = queryset[offset:offset + fetch_size]
+        if page_queryset._prefetch_related_lookups:
+            # `aiterator()` does not support `prefetch_related()` on all the
+            # supported Django versions, so evaluate the queryset instead.
+            results = [obj async for obj in page_queryset]
+        else:
+            # Stream the rows in a single chunk sized to the page, rather
+            # than the much larger default chunk size.
+            results = [
+                obj async for obj in page_queryset.aiterator(chunk_size=fetch_size)
+            ]
+        return self._build_page(results)
+
+    def _prepare_queryset(self, queryset, request, view=None):
+        """
+        Resolve the page size, ordering and cursor for this request, and
+        return the ordered and filtered queryset, or `None` if pagination
+        is disabled.
+        """
         self.page_size = self.get_page_size(request)
         if not self.page_size:
             return None
 
         self.base_url = request.build_absolute_uri()
         self.ordering = self.get_ordering(request, queryset, view)
+        self._set_ordering_lookups(self.ordering)
 
         self.cursor = self.decode_cursor(request)
         if self.cursor is None:
-            (offset, reverse, current_position) = (0, False, None)
+            (reverse, current_position) = (False, None)
         else:
-            (offset, reverse, current_position) = self.cursor
+            (_, reverse, current_position) = self.cursor
 
         # Cursor pagination always enforces an ordering.
         if reverse:
@@ -75,23 +160,39 @@ class CursorPagination(BasePagination):
 
         # If we have a cursor with a fixed position then filter by that.
         if current_position is not None:
-            order = self.ordering[0]
-            is_reversed = order.startswith('-')
-            order_attr = order.lstrip('-')
-
             # Test for: (cursor reversed) XOR (queryset reversed)
-            if self.cursor.reverse != is_reversed:
-                kwargs = {order_attr + '__lt': current_position}
+            if self.cursor.reverse != self._is_reversed:
+                kwargs = {self._lt_lookup: current_position}
             else:
-                kwargs = {order_attr + '__gt': current_position}
+                kwargs = {self._gt_lookup: current_position}
 
             queryset = queryset.filter(**kwargs)
 
-        # If we have an offset cursor then offset the entire page by that amount.
-        # We also always fetch an extra item in order to determine if there is a
-        # page following on from this one.
-        results = list(queryset[offset:offset + self.page_size + 1])
+        return queryset
+
+    def _set_ordering_lookups(self, ordering):
+        """
+        Precompute the ordering direction and filter lookups derived from
+        the first ordering field.
+        """
+        order = ordering[0]
+        order_attr = order.lstrip('-')
+        self._is_reversed = order.startswith('-')
+        self._lt_lookup = order_attr + '__lt'
+        self._gt_lookup = order_attr + '__gt'
+
+    def _build_page(self, results):
+        """
+        Given the fetched results (including the extra lookahead item),
+        set up the page and the next and previous positions.
+        """
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
         self.page = list(results[:self.page_size])
+        self._cached_links = None
 
         # Determine the position of the final item following the page.
         if len(results) > len(self.page):
@@ -129,9 +230,6 @@ class CursorPagination(BasePagination):
 
         return self.page
 
-    async def apaginate_queryset(self, queryset, request, view=None):
-        return await sync_to_async(self.paginate_queryset)(queryset, request, view)
-
     def get_page_size(self, request):
         if self.page_size_query_param:
             try:
@@ -155,23 +253,15 @@ class CursorPagination(BasePagination):
             compare = self._get_position_from_instance(self.page[-1], self.ordering)
         else:
             compare = self.next_position
-        offset = 0
-
-        has_item_with_unique_position = False
-        for item in reversed(self.page):
-            position = self._get_position_from_instance(item, self.ordering)
-            if position != compare:
-                # The item in this position and the item following it
-                # have different positions. We can use this position as
-                # our marker.
-                has_item_with_unique_position = True
-                break
-
-            # The item in this position has the same position as the item
-            # following it, we can't use it as a marker position, so increment
-            # the offset and keep seeking to the previous item.
-            compare = position
-            offset += 1
+
+        # The page is ordered, so if the item furthest from the marker shares
+        # its position then every item does.
+        offset, position = _find_marker(
+            self._iter_positions(reversed(self.page), self.ordering),
+            compare,
+            is_uniform=lambda: self._get_position_from_instance(self.page[0], self.ordering) == compare,
+        )
+        has_item_with_unique_position = position is not None
 
         if self.page and not has_item_with_unique_position:
             # There were no unique positions in the page.
@@ -208,23 +298,15 @@ class CursorPagination(BasePagination):
             compare = self._get_position_from_instance(self.page[0], self.ordering)
         else:
             compare = self.previous_position
-        offset = 0
-
-        has_item_with_unique_position = False
-        for item in self.page:
-            position = self._get_position_from_instance(item, self.ordering)
-            if position != compare:
-                # The item in this position and the item following it
-                # have different positions. We can use this position as
-                # our marker.
-                has_item_with_unique_position = True
-                break
-
-            # The item in this position has the same position as the item
-            # following it, we can't use it as a marker position, so increment
-            # the offset and keep seeking to the previous item.
-            compare = position
-            offset += 1
+
+        # The page is ordered, so if the item furthest from the marker shares
+        # its position then every item does.
+        offset, position = _find_marker(
+            self._iter_positions(self.page, self.ordering),
+            compare,
+            is_uniform=lambda: self._get_position_from_instance(self.page[-1], self.ordering) == compare,
+        )
+        has_item_with_unique_position = position is not None
 
         if self.page and not has_item_with_unique_position:
             # There were no unique positions in the page.
@@ -306,17 +388,28 @@ class CursorPagination(BasePagination):
             return None
 
         try:
-            querystring = b64decode(encoded.encode('ascii')).decode('ascii')
-            tokens = parse.parse_qs(querystring, keep_blank_values=True)
+            data = urlsafe_b64decode(encoded.encode('ascii'))
+            if data[:1] == bytes([_CURSOR_VERSION]):
+                _, offset, flags = _CURSOR_HEADER.unpack_from(data)
+                offset = _positive_int(offset, cutoff=self.offset_cutoff)
+                reverse = bool(flags & _CURSOR_FLAG_REVERSE)
+                if flags & _CURSOR_FLAG_POSITION:
+                    position = data[_CURSOR_HEADER.size:].decode('utf-8')
+                else:
+                    position = None
+            else:
+                # Legacy base64 encoded querystring cursor.
+                querystring = b64decode(encoded.encode('ascii')).decode('ascii')
+                tokens = dict(parse.parse_qsl(querystring, keep_blank_values=True))
 
-            offset = tokens.get('o', ['0'])[0]
-            offset = _positive_int(offset, cutoff=self.offset_cutoff)
+                offset = tokens.get('o', '0')
+                offset = _positive_int(offset, cutoff=self.offset_cutoff)
 
-            reverse = tokens.get('r', ['0'])[0]
-            reverse = bool(int(reverse))
+                reverse = tokens.get('r', '0')
+                reverse = bool(int(reverse))
 
-            position = tokens.get('p', [None])[0]
-        except (TypeError, ValueError):
+                position = tokens.get('p')
+        except (TypeError, ValueError, BinasciiError, struct.error):
             raise NotFound(self.invalid_cursor_message)
 
         return Cursor(offset=offset, reverse=reverse, position=position)
@@ -325,17 +418,34 @@ class CursorPagination(BasePagination):
         """
         Given a Cursor instance, return an url with encoded cursor.
         """
-        tokens = {}
-        if cursor.offset != 0:
-            tokens['o'] = str(cursor.offset)
+        flags = 0
+        position = b''
         if cursor.reverse:
-            tokens['r'] = '1'
+            flags |= _CURSOR_FLAG_REVERSE
         if cursor.position is not None:
-            tokens['p'] = cursor.position
+            flags |= _CURSOR_FLAG_POSITION
+            position = cursor.position.encode('utf-8')
 
-        querystring = parse.urlencode(tokens, doseq=True)
-        encoded = b64encode(querystring.encode('ascii')).decode('ascii')
-        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+        data = _CURSOR_HEADER.pack(_CURSOR_VERSION, cursor.offset, flags) + position
+
+        encoded = urlsafe_b64encode(data).decode('ascii')
+        return self._replace_cursor_query_param(encoded)
+
+    def _replace_cursor_query_param(self, encoded):
+        """
+        Same as `replace_query_param(self.base_url, self.cursor_query_param, encoded)`,
+        but the base url is only split and parsed once for all the links.
+        """
+        parsed = getattr(self, '_parsed_base_url', None)
+        if parsed is None or parsed[0] is not self.base_url:
+            parts = parse.urlsplit(force_str(self.base_url))
+            query_dict = parse.parse_qs(parts.query, keep_blank_values=True)
+            parsed = self._parsed_base_url = (self.base_url, parts, query_dict)
+
+        _, parts, query_dict = parsed
+        query_dict = {**query_dict, self.cursor_query_param: [encoded]}
+        query = parse.urlencode(sorted(query_dict.items()), doseq=True)
+        return parse.urlunsplit(parts._replace(query=query))
 
     def _get_position_from_instance(self, instance, ordering):
         field_name = ordering[0].lstrip('-')
@@ -345,12 +455,39 @@ class CursorPagination(BasePagination):
             attr = getattr(instance, field_name)
         return str(attr)
 
+    def _iter_positions(self, items, ordering):
+        """
+        Lazily return the positions of `items`, resolving the field lookup
+        only once. Overrides of `_get_position_from_instance()` are always
+        respected.
+        """
+        if type(self)._get_position_from_instance is not CursorPagination._get_position_from_instance:
+            return map(partial(self._get_position_from_instance, ordering=ordering), items)
+
+        field_name = ordering[0].lstrip('-')
+        if self.page and isinstance(self.page[0], dict):
+            getter = operator.itemgetter(field_name)
+        else:
+            getter = operator.attrgetter(field_name)
+        return map(str, map(getter, items))
+
+    def _get_links(self):
+        """
+        Return the next and previous links for the current page. They are
+        computed once per page, as both the paginated response and the
+        browsable API controls need them.
+        """
+        if self._cached_links is None:
+            self._cached_links = (self.get_next_link(), self.get_previous_link())
+        return self._cached_links
+
     def get_paginated_response(self, data):
-        return Response(OrderedDict([
-            ('next', self.get_next_link()),
-            ('previous', self.get_previous_link()),
-            ('results', data)
-        ]))
+        next_link, previous_link = self._get_links()
+        return Response({
+            'next': next_link,
+            'previous': previous_link,
+            'results': data,
+        })
 
     def get_paginated_response_schema(self, schema):
         return {
@@ -369,9 +506,10 @@ class CursorPagination(BasePagination):
         }
 
     def get_html_context(self):
+        next_link, previous_link = self._get_links()
         return {
-            'previous_url': self.get_previous_link(),
-            'next_url': self.get_next_link()
+            'previous_url': previous_link,
+            'next_url': next_link
         }
 
     def to_html(self):
@@ -7,18 +7,30 @@ from rest_framework import relations
 class ManyRelatedField(relations.ManyRelatedField):
 
     async def ato_representation(self, iterable: Iterable | models.QuerySet):
-        objects = iterable
+        child_to_representation = self.child_relation.to_representation
         if isinstance(iterable, models.QuerySet):
-            objects = [obj async for obj in iterable]
-        return [
-            self.child_relation.to_representation(obj)
-            for obj in objects
-        ]
+            if iterable._result_cache is None and not iterable._prefetch_related_lookups:
+                # Stream the rows instead of building the result cache first.
+                iterable = iterable.aiterator()
+            return [child_to_representation(obj) async for obj in iterable]
+        return [child_to_representation(obj) for obj in iterable]
 
 
 class PrimaryKeyRelatedField(relations.PrimaryKeyRelatedField):
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if self.pk_field is None:
+            # Bind the specialized coroutine once instead of checking
+            # `pk_field` on every call.
+            self.ato_representation = self._ato_representation_pk
+
     async def ato_representation(self, value):
         if self.pk_field is not None:
-            return await self.pk_field.ato_representation(value.pk)
+            if hasattr(self.pk_field, 'ato_representation'):
+                return await self.pk_field.ato_representation(value.pk)
+            return self.pk_field.to_representation(value.pk)
+        return value.pk
+
+    async def _ato_representation_pk(self, value):
         return value.pk
@@ -0,0 +1,52 @@
+"""
+Renderers that can be used in place of the default DRF renderers.
+"""
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renderer which serializes to JSON using `orjson`, which is significantly
+    faster than the standard library `json` module on large payloads.
+
+    The output matches `JSONRenderer` with the default settings, with a few
+    differences: non-finite floats (NaN and Infinity) are rendered as `null`
+    instead of raising, any requested indent is rendered with two spaces,
+    and the `UNICODE_JSON` setting is ignored (the output is always UTF-8).
+    Data that orjson can't serialize, such as integers beyond 64 bits, is
+    rendered with `JSONRenderer` instead.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        assert orjson is not None, 'orjson must be installed to use `ORJSONRenderer`'
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        # Let the DRF encoder format datetimes, so they match `JSONRenderer`.
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=option)
+        except TypeError:
+            # orjson doesn't support integers beyond 64 bits, and doesn't pass
+            # them to `default`, so fall back to the standard renderer.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # We always fully escape \u2028 and \u2029 to ensure we output JSON
+        # that is a strict javascript subset, same as `JSONRenderer`.
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -1,3 +1,4 @@
+import asyncio
 import traceback
 from collections import OrderedDict
 
@@ -15,6 +16,43 @@ from rest_framework.serializers import model_meta, raise_errors_on_nested_writes
 from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
 
 
+async def _gather(coros):
+    """
+    Run the coroutines concurrently and return their results in order. If
+    one of them fails, the others are cancelled and awaited before the
+    original exception is raised, so no work is left running in the
+    background.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+_drf_field_types_cache = (None, frozenset())
+
+
+def _get_drf_field_types():
+    """
+    Return the plain DRF field types, which are represented with the sync
+    `to_representation()`. The set is rebuilt when the field mapping changes,
+    so field types registered after import are picked up.
+    """
+    global _drf_field_types_cache
+    mapping = DRFModelSerializer.serializer_field_mapping
+    choice_field = DRFModelSerializer.serializer_choice_field
+    key = (len(mapping), choice_field)
+    cached_key, field_types = _drf_field_types_cache
+    if cached_key != key:
+        field_types = frozenset([*mapping.values(), choice_field])
+        _drf_field_types_cache = (key, field_types)
+    return field_types
+
+
 class BaseSerializer(DRFBaseSerializer):
     """
     Base serializer class.
@@ -124,6 +162,11 @@ class _Serializer(metaclass=DRFSerializerMetaclass):
 
 
 class Serializer(BaseSerializer, _Serializer, DRFSerializer):
+    # Set to `True` to resolve the async field representations of an instance
+    # concurrently. Only worth it when several fields do real async I/O, as
+    # each field then runs in its own task.
+    concurrent_async_fields = False
+
     @async_property
     async def adata(self):
         """
@@ -141,6 +184,9 @@ class Serializer(BaseSerializer, _Serializer, DRFSerializer):
 
         ret = OrderedDict()
         fields = self._readable_fields
+        concurrent = self.concurrent_async_fields
+        drf_field_types = _get_drf_field_types()
+        async_fields = []
 
         for field in fields:
             try:
@@ -148,21 +194,31 @@ class Serializer(BaseSerializer, _Serializer, DRFSerializer):
             except SkipField:
                 continue
 
-            is_drf_field = type(field) in list(
-                DRFModelSerializer.serializer_field_mapping.values()
-            ) + [DRFModelSerializer.serializer_choice_field]
+            is_drf_field = type(field) in drf_field_types
 
             check_for_none = (
                 attribute.pk if isinstance(attribute, models.Model) else attribute
             )
             if check_for_none is None:
                 ret[field.field_name] = None
+            elif is_drf_field:
+                ret[field.field_name] = field.to_representation(attribute)
+            elif concurrent:
+                # Reserve the key so the field order is preserved, the
+                # async representations are resolved together below.
+                ret[field.field_name] = None
+                async_fields.append((field, attribute))
             else:
-                if is_drf_field:
-                    repr = field.to_representation(attribute)
-                else:
-                    repr = await field.ato_representation(attribute)
-
+                ret[field.field_name] = await field.ato_representation(attribute)
+
+        if len(async_fields) == 1:
+            field, attribute = async_fields[0]
+            ret[field.field_name] = await field.ato_representation(attribute)
+        elif async_fields:
+            reprs = await _gather(
+                field.ato_representation(attribute) for field, attribute in async_fields
+            )
+            for (field, _), repr in zip(async_fields, reprs):
                 ret[field.field_name] = repr
 
         return ret
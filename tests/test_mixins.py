@@ -0,0 +1,172 @@
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from adrf.generics import CreateListAPIView
+from adrf.mixins import _validation_is_in_memory
+from adrf.serializers import ModelSerializer, Serializer
+from rest_framework import serializers, status
+from rest_framework.test import APIRequestFactory
+from rest_framework.validators import UniqueValidator
+
+factory = APIRequestFactory()
+
+
+class UserSerializer(ModelSerializer):
+    class Meta:
+        model = User
+        fields = ("username",)
+
+
+class NameSerializer(Serializer):
+    name = serializers.CharField()
+
+    async def acreate(self, validated_data):
+        return validated_data
+
+
+class NestedSerializer(Serializer):
+    user = UserSerializer()
+
+
+class RelatedSerializer(Serializer):
+    user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
+
+
+class UniqueNameSerializer(NameSerializer):
+    name = serializers.CharField(
+        source="username",
+        validators=[UniqueValidator(queryset=User.objects.all())],
+    )
+
+    async def acreate(self, validated_data):
+        return validated_data
+
+
+class ValidateNameSerializer(NameSerializer):
+    def validate_name(self, value):
+        if User.objects.filter(username=value).exists():
+            raise serializers.ValidationError("Name taken.")
+        return value
+
+
+class ValidateSerializer(NameSerializer):
+    def validate(self, attrs):
+        if User.objects.filter(username=attrs["name"]).exists():
+            raise serializers.ValidationError("Name taken.")
+        return attrs
+
+
+class DefaultNameSerializer(NameSerializer):
+    name = serializers.CharField(default=lambda: User.objects.first().username)
+
+
+class UserListSerializer(NameSerializer):
+    users = serializers.ListField(
+        child=serializers.PrimaryKeyRelatedField(queryset=User.objects.all()),
+        write_only=True,
+    )
+
+
+class CustomChildSerializer(NameSerializer):
+    values = serializers.DictField(
+        child=serializers.CharField(
+            validators=[UniqueValidator(queryset=User.objects.all())]
+        )
+    )
+
+
+class IsValidSerializer(NameSerializer):
+    def is_valid(self, raise_exception=False):
+        return super().is_valid(raise_exception=raise_exception)
+
+
+class RunValidatorsSerializer(NameSerializer):
+    def run_validators(self, value):
+        return super().run_validators(value)
+
+
+class UserCreateView(CreateListAPIView):
+    queryset = User.objects.all()
+    serializer_class = UserSerializer
+
+
+class NameCreateView(CreateListAPIView):
+    queryset = User.objects.all()
+    serializer_class = NameSerializer
+
+
+class TestValidation(TestCase):
+    def test_validation_is_in_memory(self):
+        assert _validation_is_in_memory(NameSerializer(data={}))
+        assert _validation_is_in_memory(NameSerializer(data=[], many=True))
+        assert not _validation_is_in_memory(UserSerializer(data={}))
+        assert not _validation_is_in_memory(NestedSerializer(data={}))
+        assert not _validation_is_in_memory(RelatedSerializer(data={}))
+        assert not _validation_is_in_memory(UniqueNameSerializer(data={}))
+        assert not _validation_is_in_memory(ValidateNameSerializer(data={}))
+        assert not _validation_is_in_memory(ValidateSerializer(data={}))
+        assert not _validation_is_in_memory(DefaultNameSerializer(data={}))
+        assert not _validation_is_in_memory(UserListSerializer(data={}))
+        assert not _validation_is_in_memory(CustomChildSerializer(data={}))
+        assert not _validation_is_in_memory(IsValidSerializer(data={}))
+        assert not _validation_is_in_memory(RunValidatorsSerializer(data={}))
+
+    def test_create_model_serializer(self):
+        User.objects.create_user("taken")
+        view = UserCreateView.as_view()
+
+        response = async_to_sync(view)(factory.post("/", {"username": "new"}))
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = async_to_sync(view)(factory.post("/", {"username": "taken"}))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_serializer(self):
+        view = NameCreateView.as_view()
+
+        response = async_to_sync(view)(factory.post("/", {"name": "test"}))
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {"name": "test"}
+
+        response = async_to_sync(view)(factory.post("/", {}))
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_serializer_with_database_validation(self):
+        User.objects.create_user("taken")
+        for serializer_class in (
+            UniqueNameSerializer,
+            ValidateNameSerializer,
+            ValidateSerializer,
+        ):
+            view = NameCreateView.as_view(serializer_class=serializer_class)
+
+            response = async_to_sync(view)(factory.post("/", {"name": "new"}))
+            assert response.status_code == status.HTTP_201_CREATED
+
+            response = async_to_sync(view)(factory.post("/", {"name": "taken"}))
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_create_serializer_with_callable_default(self):
+        User.objects.create_user("first")
+        view = NameCreateView.as_view(serializer_class=DefaultNameSerializer)
+
+        response = async_to_sync(view)(factory.post("/", {}))
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {"name": "first"}
+
+    def test_create_serializer_with_list_of_related_fields(self):
+        user = User.objects.create_user("user")
+        view = NameCreateView.as_view(serializer_class=UserListSerializer)
+
+        request = factory.post(
+            "/", {"name": "test", "users": [user.pk]}, format="json"
+        )
+        response = async_to_sync(view)(request)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        request = factory.post(
+            "/", {"name": "test", "users": [user.pk + 1]}, format="json"
+        )
+        response = async_to_sync(view)(request)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
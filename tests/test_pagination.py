@@ -0,0 +1,211 @@
+import datetime
+from base64 import b64encode
+from unittest import mock
+from urllib.parse import unquote
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from adrf.generics import ListAPIView
+from adrf.pagination import CursorPagination, _find_marker
+from adrf.serializers import ModelSerializer
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework.utils.urls import replace_query_param
+
+factory = APIRequestFactory()
+
+
+class UserSerializer(ModelSerializer):
+    class Meta:
+        model = User
+        fields = ("username",)
+
+
+class UserCursorPagination(CursorPagination):
+    page_size = 2
+    ordering = "username"
+
+
+class UserListView(ListAPIView):
+    queryset = User.objects.all()
+    serializer_class = UserSerializer
+    pagination_class = UserCursorPagination
+
+
+class TestCursorPagination(TestCase):
+    def setUp(self):
+        for username in ("a", "b", "c", "d", "e"):
+            User.objects.create_user(username)
+        self.view = UserListView.as_view()
+
+    def get_page(self, url):
+        response = async_to_sync(self.view)(factory.get(url))
+        usernames = [item["username"] for item in response.data["results"]]
+        return usernames, response.data["next"], response.data["previous"]
+
+    def test_forward_and_backward(self):
+        usernames, next_url, previous_url = self.get_page("/")
+        assert usernames == ["a", "b"]
+        assert previous_url is None
+
+        usernames, next_url, previous_url = self.get_page(next_url)
+        assert usernames == ["c", "d"]
+        assert previous_url is not None
+
+        usernames, next_url, _ = self.get_page(next_url)
+        assert usernames == ["e"]
+        assert next_url is None
+
+        usernames, _, _ = self.get_page(previous_url)
+        assert usernames == ["a", "b"]
+
+    async def test_apaginate_queryset_with_prefetch_related(self):
+        request = Request(factory.get("/"))
+        page = await UserCursorPagination().apaginate_queryset(
+            User.objects.prefetch_related("groups"), request
+        )
+        assert [user.username for user in page] == ["a", "b"]
+
+    async def test_values_queryset(self):
+        pagination = UserCursorPagination()
+        page = await pagination.apaginate_queryset(
+            User.objects.values("username"), Request(factory.get("/"))
+        )
+        assert page == [{"username": "a"}, {"username": "b"}]
+
+        request = Request(factory.get(pagination.get_next_link()))
+        page = await pagination.apaginate_queryset(
+            User.objects.values("username"), request
+        )
+        assert page == [{"username": "c"}, {"username": "d"}]
+
+    def test_duplicate_positions(self):
+        class DuplicateCursorPagination(UserCursorPagination):
+            ordering = "first_name"
+
+        User.objects.update(first_name="same")
+        view = UserListView.as_view(pagination_class=DuplicateCursorPagination)
+
+        usernames = []
+        url = "/"
+        while url is not None:
+            response = async_to_sync(view)(factory.get(url))
+            usernames += [item["username"] for item in response.data["results"]]
+            url = response.data["next"]
+        assert sorted(usernames) == ["a", "b", "c", "d", "e"]
+
+        response = async_to_sync(view)(factory.get(response.data["previous"]))
+        assert len(response.data["results"]) == 2
+
+    def test_overridden_position_with_duplicates(self):
+        class DateCursorPagination(UserCursorPagination):
+            ordering = "date_joined"
+
+            def _get_position_from_instance(self, instance, ordering):
+                return instance.date_joined.isoformat()
+
+        # Three users per date: a-c, d-f and g.
+        User.objects.create_user("f")
+        User.objects.create_user("g")
+        for index, user in enumerate(User.objects.order_by("username")):
+            user.date_joined = datetime.datetime(
+                2024, 1, 1 + index // 3, tzinfo=datetime.timezone.utc
+            )
+            user.save()
+        view = UserListView.as_view(pagination_class=DateCursorPagination)
+
+        usernames = []
+        url = "/"
+        while url is not None:
+            response = async_to_sync(view)(factory.get(url))
+            usernames += [item["username"] for item in response.data["results"]]
+            url = response.data["next"]
+        assert sorted(usernames) == ["a", "b", "c", "d", "e", "f", "g"]
+
+    async def test_links_computed_once(self):
+        pagination = UserCursorPagination()
+        await pagination.apaginate_queryset(
+            User.objects.all(), Request(factory.get("/"))
+        )
+        with mock.patch.object(
+            pagination, "encode_cursor", wraps=pagination.encode_cursor
+        ) as encode_cursor:
+            response = pagination.get_paginated_response([])
+            context = pagination.get_html_context()
+
+        assert encode_cursor.call_count == 1
+        assert context["next_url"] == response.data["next"]
+        assert context["previous_url"] is None
+
+
+class TestCursorEncoding(TestCase):
+    def setUp(self):
+        self.pagination = UserCursorPagination()
+        self.pagination.base_url = "http://testserver/"
+
+    def decode(self, url):
+        return self.pagination.decode_cursor(Request(factory.get(url)))
+
+    def test_round_trip(self):
+        for cursor in (
+            Cursor(offset=0, reverse=False, position=None),
+            Cursor(offset=3, reverse=True, position="b"),
+            Cursor(offset=0, reverse=False, position=""),
+            Cursor(offset=1, reverse=False, position="\u00e9t\u00e9"),
+        ):
+            assert self.decode(self.pagination.encode_cursor(cursor)) == cursor
+
+    def test_base_url_query_params(self):
+        self.pagination.base_url = "http://testserver/?page_size=2&cursor=old&a=1"
+        cursor = Cursor(offset=0, reverse=True, position="b")
+        url = self.pagination.encode_cursor(cursor)
+
+        encoded = url.split("cursor=")[1].split("&")[0]
+        assert url == replace_query_param(
+            self.pagination.base_url, "cursor", unquote(encoded)
+        )
+        assert self.decode(url) == cursor
+
+        self.pagination.base_url = "http://testserver/other/"
+        assert self.pagination.encode_cursor(cursor).startswith(
+            "http://testserver/other/?cursor="
+        )
+
+    def test_legacy_cursor(self):
+        encoded = b64encode(b"o=3&r=1&p=b").decode("ascii")
+        cursor = self.decode("/?cursor=" + encoded)
+        assert cursor == Cursor(offset=3, reverse=True, position="b")
+
+    def test_legacy_cursor_quoted_position(self):
+        encoded = b64encode(b"p=a%26b+c").decode("ascii")
+        cursor = self.decode("/?cursor=" + encoded)
+        assert cursor == Cursor(offset=0, reverse=False, position="a&b c")
+
+    def test_invalid_cursor(self):
+        for encoded in ("invalid", "AQ==", "AQAAAAAC_w=="):
+            with self.assertRaises(NotFound):
+                self.decode("/?cursor=" + encoded)
+
+
+def test_find_marker():
+    assert _find_marker(["c", "b", "a"], "d") == (0, "c")
+    assert _find_marker(["c", "c", "b"], "c") == (2, "b")
+    assert _find_marker(["c", "c"], "c") == (2, None)
+    assert _find_marker([], "c") == (0, None)
+
+
+def test_find_marker_is_uniform():
+    is_uniform = mock.Mock(return_value=True)
+    assert _find_marker(["c", "b"], "d", is_uniform) == (0, "c")
+    assert not is_uniform.called
+
+    assert _find_marker(iter(["c", "c"]), "c", is_uniform) == (0, None)
+    is_uniform.assert_called_once_with()
+
+    is_uniform = mock.Mock(return_value=False)
+    assert _find_marker(["c", "c", "b"], "c", is_uniform) == (2, "b")
+    is_uniform.assert_called_once_with()
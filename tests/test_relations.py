@@ -0,0 +1,49 @@
+import copy
+
+from django.contrib.auth.models import Group, User
+from django.test import TestCase
+
+from adrf.relations import ManyRelatedField, PrimaryKeyRelatedField
+from rest_framework.fields import CharField
+
+
+class TestManyRelatedField(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("user")
+        self.groups = [Group.objects.create(name=name) for name in ("a", "b")]
+        self.user.groups.set(self.groups)
+        self.field = ManyRelatedField(
+            child_relation=PrimaryKeyRelatedField(read_only=True)
+        )
+
+    async def test_queryset(self):
+        representation = await self.field.ato_representation(
+            self.user.groups.order_by("pk")
+        )
+        assert representation == [group.pk for group in self.groups]
+
+    async def test_prefetched_queryset(self):
+        user = await User.objects.prefetch_related("groups").aget(pk=self.user.pk)
+        representation = await self.field.ato_representation(user.groups.all())
+        assert sorted(representation) == [group.pk for group in self.groups]
+
+    async def test_list(self):
+        representation = await self.field.ato_representation(self.groups)
+        assert representation == [group.pk for group in self.groups]
+
+
+class TestPrimaryKeyRelatedField(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("user")
+
+    async def test_pk(self):
+        field = PrimaryKeyRelatedField(read_only=True)
+        assert await field.ato_representation(self.user) == self.user.pk
+
+    async def test_pk_field(self):
+        field = PrimaryKeyRelatedField(read_only=True, pk_field=CharField())
+        assert await field.ato_representation(self.user) == str(self.user.pk)
+
+    async def test_deepcopy(self):
+        field = copy.deepcopy(PrimaryKeyRelatedField(read_only=True))
+        assert await field.ato_representation(self.user) == self.user.pk
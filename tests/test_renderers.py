@@ -0,0 +1,70 @@
+import datetime
+import decimal
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import TestCase
+
+from adrf.renderers import ORJSONRenderer
+from adrf.views import APIView
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+orjson = pytest.importorskip("orjson")
+
+factory = APIRequestFactory()
+
+
+class ORJSONView(APIView):
+    renderer_classes = [ORJSONRenderer]
+
+    async def get(self, request):
+        return Response({"results": [{"id": 1}, {"id": 2}]})
+
+
+class TestORJSONRenderer(TestCase):
+    def test_render(self):
+        data = {
+            1: "non string key",
+            "decimal": decimal.Decimal("1.5"),
+            "date": datetime.date(2024, 1, 1),
+        }
+        rendered = ORJSONRenderer().render(data)
+        assert json.loads(rendered) == {
+            "1": "non string key",
+            "decimal": 1.5,
+            "date": "2024-01-01",
+        }
+
+    def test_render_matches_json_renderer(self):
+        data = {
+            "datetime": datetime.datetime(
+                2024, 1, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc
+            ),
+            "time": datetime.time(12, 30),
+            "separators": "\u2028\u2029",
+        }
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_render_indent(self):
+        data = {"a": [1]}
+        rendered = ORJSONRenderer().render(data, "application/json; indent=4")
+        assert rendered == b'{\n  "a": [\n    1\n  ]\n}'
+        rendered = ORJSONRenderer().render(data, renderer_context={"indent": 4})
+        assert rendered == b'{\n  "a": [\n    1\n  ]\n}'
+        assert ORJSONRenderer().render(data, "application/json") == b'{"a":[1]}'
+
+    def test_render_big_integer(self):
+        data = {"n": 2**70}
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_render_none(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_view(self):
+        response = async_to_sync(ORJSONView.as_view())(factory.get("/"))
+        response.render()
+        assert response["Content-Type"] == "application/json"
+        assert json.loads(response.content) == {"results": [{"id": 1}, {"id": 2}]}
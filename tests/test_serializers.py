@@ -1,11 +1,16 @@
+import asyncio
 from collections import ChainMap
+from unittest import mock
 
 from asgiref.sync import sync_to_async
 from django.contrib.auth.models import User
+from django.db import models
 from django.test import TestCase
 
+from adrf.fields import SerializerMethodField
 from adrf.serializers import ModelSerializer, Serializer
 from rest_framework import serializers
+from rest_framework.serializers import ModelSerializer as DRFModelSerializer
 from rest_framework.test import APIRequestFactory
 
 factory = APIRequestFactory()
@@ -225,6 +230,121 @@ class TestSerializer(TestCase):
         assert representation["password"] == default_object.password
         assert representation["age"] == default_object.age
 
+    async def test_async_fields_resolved_concurrently(self):
+        class MethodSerializer(Serializer):
+            concurrent_async_fields = True
+
+            username = serializers.CharField()
+            first = SerializerMethodField()
+            second = SerializerMethodField()
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.event = asyncio.Event()
+
+            async def get_first(self, obj):
+                # Only completes if `get_second` runs concurrently.
+                await asyncio.wait_for(self.event.wait(), timeout=1)
+                return "first"
+
+            async def get_second(self, obj):
+                self.event.set()
+                return "second"
+
+        serializer = MethodSerializer(self.default_object)
+        representation = await serializer.ato_representation(self.default_object)
+
+        assert list(representation.items()) == [
+            ("username", "test"),
+            ("first", "first"),
+            ("second", "second"),
+        ]
+
+    async def test_async_field_error_cancels_other_fields(self):
+        cancelled = asyncio.Event()
+
+        class MethodSerializer(Serializer):
+            concurrent_async_fields = True
+
+            slow = SerializerMethodField()
+            failing = SerializerMethodField()
+
+            async def get_slow(self, obj):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+            async def get_failing(self, obj):
+                await asyncio.sleep(0)
+                raise ValueError("failed")
+
+        serializer = MethodSerializer(self.default_object)
+        with self.assertRaisesMessage(ValueError, "failed"):
+            await serializer.ato_representation(self.default_object)
+        assert cancelled.is_set()
+
+    async def test_cheap_async_fields_do_not_create_tasks(self):
+        class MethodSerializer(Serializer):
+            first = SerializerMethodField()
+            second = SerializerMethodField()
+
+            async def get_first(self, obj):
+                return obj.username
+
+            async def get_second(self, obj):
+                return obj.age
+
+        objects = [MockObject(username=str(i), age=i) for i in range(1000)]
+        serializer = MethodSerializer(objects, many=True)
+
+        with mock.patch(
+            "adrf.serializers.asyncio.ensure_future", wraps=asyncio.ensure_future
+        ) as ensure_future:
+            data = await serializer.adata
+
+        assert len(data) == 1000
+        assert data[1] == {"first": "1", "second": 1}
+        assert ensure_future.call_count == 0
+
+    async def test_serializer_method_field_many(self):
+        class MethodSerializer(Serializer):
+            username = serializers.CharField()
+            upper = SerializerMethodField()
+
+            async def get_upper(self, obj):
+                return obj.username.upper()
+
+        objects = [MockObject(username="a"), MockObject(username="b")]
+        serializer = MethodSerializer(objects, many=True)
+
+        assert await serializer.adata == [
+            {"username": "a", "upper": "A"},
+            {"username": "b", "upper": "B"},
+        ]
+
+    async def test_field_mapping_registered_after_import(self):
+        class CustomModelField(models.Field):
+            pass
+
+        class CustomField(serializers.CharField):
+            pass
+
+        class CustomSerializer(Serializer):
+            username = CustomField()
+
+        mapping = DRFModelSerializer.serializer_field_mapping
+        mapping[CustomModelField] = CustomField
+        try:
+            representation = await CustomSerializer(
+                self.default_object
+            ).ato_representation(self.default_object)
+        finally:
+            del mapping[CustomModelField]
+
+        assert representation == {"username": "test"}
+
     # test that normal non-async serializers work
     def test_sync_serializer_valid(self):
         data = {